@@ -1,10 +1,18 @@
-from deepagents import create_deep_agent, async_create_deep_agent, SubAgent
+import json
+import threading
+from collections import OrderedDict
+
+from deepagents import create_deep_agent, async_create_deep_agent
 from langchain_core.tools import BaseTool, tool
 from pydantic import BaseModel
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from typing_extensions import TypedDict, NotRequired
 
 
+# Number of compiled agents each configurable builder keeps for reuse
+_MAX_CACHED_AGENTS = 8
+
+
 class SerializableSubAgent(TypedDict):
     name: str
     description: str
@@ -14,11 +22,12 @@ class SerializableSubAgent(TypedDict):
     model: NotRequired[dict[str, Any]]
 
 
-def create_configurable_agent(
+def _configurable_agent_builder(
+    create_agent: Callable,
     default_instructions: str,
     default_sub_agents: list[SerializableSubAgent],
     tools,
-    agent_config: Optional[dict] = None,
+    default_agent_config: dict,
     **kwargs,
 ):
     tools = [t if isinstance(t, BaseTool) else tool(t) for t in tools]
@@ -29,6 +38,23 @@ def create_configurable_agent(
         subagents: list[SerializableSubAgent] = default_sub_agents
         tools: list[str] = tool_names
 
+    def _create_agent(config: AgentConfig):
+        allowed_tool_names = set(config.tools)
+        return create_agent(
+            instructions=config.instructions,
+            tools=[t for t in tools if t.name in allowed_tool_names],
+            subagents=config.subagents,
+            config_schema=AgentConfig,
+            **kwargs,
+        ).with_config(default_agent_config)
+
+    # Compiling the graph is the expensive part of a build and the result is
+    # safe to share across runs, so reuse it for identical configurations.
+    # A reused graph also reuses its model (and that model's client) across
+    # runs, as already happens for a model passed in through kwargs.
+    agents_by_config = OrderedDict()
+    agents_by_config_lock = threading.Lock()
+
     def build_agent(config: Optional[dict] = None):
         if config is not None:
             config = config.get("configurable", {})
@@ -37,48 +63,59 @@ def create_configurable_agent(
         config_fields = {
             k: v for k, v in config.items() if k in ["instructions", "subagents"]
         }
-        config = AgentConfig(**config_fields)
-        return create_deep_agent(
-            instructions=config.instructions,
-            tools=[t for t in tools if t.name in config.tools],
-            subagents=config.subagents,
-            config_schema=AgentConfig,
-            **kwargs,
-        ).with_config(agent_config or {})
+        try:
+            config_key = json.dumps(config_fields, sort_keys=True)
+        except (TypeError, ValueError):
+            # Values that can't be serialized can't be keyed, so build uncached
+            return _create_agent(AgentConfig(**config_fields))
+        # JSON can map distinct values to one key (e.g. tuples and lists), so
+        # only reuse an agent built from equal fields
+        with agents_by_config_lock:
+            cached = agents_by_config.get(config_key)
+            if cached is not None and cached[0] == config_fields:
+                agents_by_config.move_to_end(config_key)
+                return cached[1]
+        agent = _create_agent(AgentConfig(**config_fields))
+        with agents_by_config_lock:
+            agents_by_config[config_key] = (config_fields, agent)
+            # Overwriting an existing (colliding) key keeps its old position
+            agents_by_config.move_to_end(config_key)
+            if len(agents_by_config) > _MAX_CACHED_AGENTS:
+                agents_by_config.popitem(last=False)
+        return agent
 
     return build_agent
 
 
-def async_create_configurable_agent(
+def create_configurable_agent(
     default_instructions: str,
     default_sub_agents: list[SerializableSubAgent],
     tools,
     agent_config: Optional[dict] = None,
     **kwargs,
 ):
-    tools = [t if isinstance(t, BaseTool) else tool(t) for t in tools]
-    tool_names = [t.name for t in tools]
-
-    class AgentConfig(BaseModel):
-        instructions: str = default_instructions
-        subagents: list[SerializableSubAgent] = default_sub_agents
-        tools: list[str] = tool_names
+    return _configurable_agent_builder(
+        create_deep_agent,
+        default_instructions,
+        default_sub_agents,
+        tools,
+        agent_config or {},
+        **kwargs,
+    )
 
-    def build_agent(config: Optional[dict] = None):
-        if config is not None:
-            config = config.get("configurable", {})
-        else:
-            config = {}
-        config_fields = {
-            k: v for k, v in config.items() if k in ["instructions", "subagents"]
-        }
-        config = AgentConfig(**config_fields)
-        return async_create_deep_agent(
-            instructions=config.instructions,
-            tools=[t for t in tools if t.name in config.tools],
-            subagents=config.subagents,
-            config_schema=AgentConfig,
-            **kwargs,
-        ).with_config(agent_config or {"recursion_limit": 1000})
 
-    return build_agent
+def async_create_configurable_agent(
+    default_instructions: str,
+    default_sub_agents: list[SerializableSubAgent],
+    tools,
+    agent_config: Optional[dict] = None,
+    **kwargs,
+):
+    return _configurable_agent_builder(
+        async_create_deep_agent,
+        default_instructions,
+        default_sub_agents,
+        tools,
+        agent_config or {"recursion_limit": 1000},
+        **kwargs,
+    )
@@ -18,6 +18,10 @@ from deepagents.prompts import BASE_AGENT_PROMPT
 StateSchema = TypeVar("StateSchema", bound=DeepAgentState)
 StateSchemaType = Type[StateSchema]
 
+# Built-in tools are fixed for the process, so index them by name once
+_ALL_BUILTIN_TOOLS = [write_todos, write_file, read_file, ls, edit_file]
+_BUILTIN_TOOLS_BY_NAME = {tool_.name: tool_ for tool_ in _ALL_BUILTIN_TOOLS}
+
 
 def _agent_builder(
     tools: Sequence[Union[BaseTool, Callable, dict[str, Any]]],
@@ -35,18 +39,11 @@ def _agent_builder(
 ):
     prompt = instructions + BASE_AGENT_PROMPT
 
-    all_builtin_tools = [write_todos, write_file, read_file, ls, edit_file]
-
     if builtin_tools is not None:
-        tools_by_name = {}
-        for tool_ in all_builtin_tools:
-            if not isinstance(tool_, BaseTool):
-                tool_ = tool(tool_)
-            tools_by_name[tool_.name] = tool_
         # Only include built-in tools whose names are in the specified list
-        built_in_tools = [tools_by_name[_tool] for _tool in builtin_tools]
+        built_in_tools = [_BUILTIN_TOOLS_BY_NAME[_tool] for _tool in builtin_tools]
     else:
-        built_in_tools = all_builtin_tools
+        built_in_tools = list(_ALL_BUILTIN_TOOLS)
 
     if model is None:
         model = get_default_model()
@@ -60,7 +57,8 @@ def _agent_builder(
         )
     elif post_model_hook is not None:
         selected_post_model_hook = post_model_hook
-    elif interrupt_config is not None:
+    elif interrupt_config is not None and any(interrupt_config.values()):
+        # A config where no tool interrupts would add a hook node that never acts
         selected_post_model_hook = create_interrupt_hook(interrupt_config)
     else:
         selected_post_model_hook = None
@@ -84,11 +82,12 @@ def _agent_builder(
             selected_post_model_hook,
         )
     if main_agent_tools is not None:
+        main_agent_tool_names = set(main_agent_tools)
         passed_in_tools = []
         for tool_ in tools:
             if not isinstance(tool_, BaseTool):
                 tool_ = tool(tool_)
-            if tool_.name in main_agent_tools:
+            if tool_.name in main_agent_tool_names:
                 passed_in_tools.append(tool_)
     else:
         passed_in_tools = list(tools)
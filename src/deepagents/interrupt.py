@@ -1,6 +1,6 @@
 """Interrupt configuration functionality for deep agents using LangGraph prebuilts."""
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Union
 from langgraph.types import interrupt
 from langgraph.prebuilt.interrupt import (
     HumanInterruptConfig,
@@ -39,19 +39,19 @@ def create_interrupt_hook(
 
         last_message = messages[-1]
 
-        if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
+        if not getattr(last_message, "tool_calls", None):
             return
 
         # Separate tool calls that need interrupts from those that don't
         interrupt_tool_calls = []
-        auto_approved_tool_calls = []
+        approved_tool_calls = []
 
         for tool_call in last_message.tool_calls:
             tool_name = tool_call["name"]
             if tool_name in tool_configs and tool_configs[tool_name]:
                 interrupt_tool_calls.append(tool_call)
             else:
-                auto_approved_tool_calls.append(tool_call)
+                approved_tool_calls.append(tool_call)
 
         # If no interrupts needed, return early
         if not interrupt_tool_calls:
@@ -64,8 +64,6 @@ def create_interrupt_hook(
             )
         tool_call = interrupt_tool_calls[0]
 
-        approved_tool_calls = auto_approved_tool_calls.copy()
-
         tool_name = tool_call["name"]
         tool_args = tool_call["args"]
         description = f"{message_prefix}\n\nTool: {tool_name}\nArgs: {tool_args}"
@@ -66,11 +66,8 @@ def read_file(
     # Format output with line numbers (cat -n format)
     result_lines = []
     for i in range(start_idx, end_idx):
-        line_content = lines[i]
-
         # Truncate lines longer than 2000 characters
-        if len(line_content) > 2000:
-            line_content = line_content[:2000]
+        line_content = lines[i][:2000]
 
         # Line numbers start at 1, so add 1 to the index
         line_number = i + 1
@@ -117,16 +114,17 @@ def edit_file(
     content = mock_filesystem[file_path]
 
     # Check if old_string exists in the file
-    if old_string not in content:
+    first_idx = content.find(old_string)
+    if first_idx == -1:
         return f"Error: String not found in file: '{old_string}'"
 
-    # If not replace_all, check for uniqueness
+    # If not replace_all, check for uniqueness by looking for a second
+    # non-overlapping match; only count every occurrence for the error message
     if not replace_all:
-        occurrences = content.count(old_string)
-        if occurrences > 1:
+        next_idx = content.find(old_string, first_idx + max(len(old_string), 1))
+        if next_idx != -1:
+            occurrences = content.count(old_string)
             return f"Error: String '{old_string}' appears {occurrences} times in file. Use replace_all=True to replace all instances, or provide a more specific string with surrounding context."
-        elif occurrences == 0:
-            return f"Error: String not found in file: '{old_string}'"
 
     # Perform the replacement
     if replace_all:
@@ -134,9 +132,10 @@ def edit_file(
         replacement_count = content.count(old_string)
         result_msg = f"Successfully replaced {replacement_count} instance(s) of the string in '{file_path}'"
     else:
-        new_content = content.replace(
-            old_string, new_string, 1
-        )  # Replace only first occurrence
+        # Splice in place of the unique match found above
+        new_content = (
+            content[:first_idx] + new_string + content[first_idx + len(old_string) :]
+        )
         result_msg = f"Successfully replaced string in '{file_path}'"
 
     # Update the mock filesystem